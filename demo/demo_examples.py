@@ -7,13 +7,36 @@ Example runs showing different protein types and KLTOE capabilities.
 Demo version only - Full implementation available under license.
 """
 
+import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
 from kltoe_demo import KLTOEDemo
 
-def run_examples():
-    """Run demo examples for different protein types"""
+# Per-process demo instance used by worker processes
+_worker_demo = None
+
+def _init_worker():
+    """Create the demo instance for a worker process"""
+    global _worker_demo
+    _worker_demo = KLTOEDemo()
+
+def _fold_one(sequence: str):
+    """Fold a single example sequence in a worker process"""
+    return _worker_demo.fold_protein(sequence, show_progress=False)
+
+def run_examples(batch: bool = False, quiet: bool = False, jobs: int = 1):
+    """Run demo examples for different protein types
+    
+    Args:
+        batch: Run all examples without pausing for Enter between them
+        quiet: Skip the banner and licensing information
+        jobs: Number of worker processes to fold the examples with
+    """
     
     demo = KLTOEDemo()
-    demo.show_banner()
+    if not quiet:
+        demo.show_banner()
     
     examples = [
         ("Alpha-helical peptide", "MKTAYIAKQRQISFVKSHFSRQ"),
@@ -22,25 +45,66 @@ def run_examples():
         ("Mixed structure", "GSPATVSTYQRKFMWLNPGE")
     ]
     
+    # Examples are independent, so fold them all up front and print in order
+    sequences = [sequence for _, sequence in examples]
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            results = list(pool.map(_fold_one, sequences))
+    else:
+        results = [demo.fold_protein(sequence, show_progress=False) for sequence in sequences]
+    
     print("🧪 RUNNING KLTOE DEMO EXAMPLES")
     print("=" * 50)
     
-    for i, (name, sequence) in enumerate(examples, 1):
+    for i, ((name, sequence), result) in enumerate(zip(examples, results), 1):
         print(f"\n[{i}/{len(examples)}] {name}")
         print("-" * 30)
         
-        result = demo.fold_protein(sequence, show_progress=False)
-        
         print(f"Sequence: {sequence}")
         print(f"Secondary Structure: {result.secondary_structure}")
         print(f"Confidence: {result.confidence:.3f}")
         print(f"Enhancement: {result.enhancement_percentage:.1f}%")
         print(f"Energy: {result.energy:.2f} kJ/mol")
         
-        if i < len(examples):
+        if i < len(examples) and not batch:
             input("\nPress Enter for next example...")
     
-    demo.show_licensing_info()
+    if not quiet:
+        demo.show_licensing_info()
+
+def main():
+    """Demo examples entry point"""
+    parser = argparse.ArgumentParser(
+        description="KLTOE Quantum-Enhanced Protein Folding - Demo Examples",
+        epilog="Full implementation available under commercial license. Contact: keith@kltoe.org"
+    )
+    
+    parser.add_argument(
+        "--batch", "-b",
+        action="store_true",
+        help="Run all examples without pausing (also enabled by KLTOE_BATCH)"
+    )
+    
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Skip banner and licensing information"
+    )
+    
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Fold examples in this many worker processes (default: 1, in-process)"
+    )
+    
+    args = parser.parse_args()
+    
+    run_examples(
+        batch=args.batch or bool(os.environ.get("KLTOE_BATCH")),
+        quiet=args.quiet,
+        jobs=args.jobs
+    )
 
 if __name__ == "__main__":
-    run_examples()
\ No newline at end of file
+    main()
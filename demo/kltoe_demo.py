@@ -13,12 +13,17 @@ For licensing: keith@kltoe.org
 Patent applications pending.
 """
 
-import numpy as np
+import os
+import re
+import sys
 import time
 import argparse
-from typing import Dict, Tuple, Optional
+from typing import TYPE_CHECKING, Dict, Tuple, Optional
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # Demo banner
 DEMO_BANNER = """
 ╔══════════════════════════════════════════════════════════════╗
@@ -41,7 +46,63 @@ Full implementation requires commercial license.
 Patent applications pending. All rights reserved.
 """
 
-@dataclass
+# Summary block printed by display_results
+_RESULT_TEMPLATE = """\
+Sequence: {sequence}
+Length: {length} residues
+Secondary Structure: {secondary_structure}
+Confidence: {confidence:.3f}
+Final Energy: {energy:.2f} kJ/mol
+Enhancement: {enhancement_percentage:.1f}% improvement over classical
+Folding Time: {folding_time:.2f} seconds"""
+
+# Matches the first character that is not one of the 20 standard amino acids
+_INVALID_AA_RE = re.compile(r"[^ACDEFGHIKLMNPQRSTVWY]")
+
+# Residue classes for the demo secondary-structure heuristic
+_HELIX_AA = frozenset("AELM")  # Helix-favoring
+_BETA_AA = frozenset("VIFY")  # Beta-favoring
+
+# Secondary-structure translation table for bytes.translate: helix-favoring
+# residues map to "H", beta-favoring to "B", everything else to "L"
+_SS_TABLE = bytes(
+    ord("H") if chr(i) in _HELIX_AA else ord("B") if chr(i) in _BETA_AA else ord("L")
+    for i in range(256)
+)
+
+def _demo_kernel(
+    codes: bytes, r: "np.ndarray", corr_offset: "np.ndarray", corr_scale: "np.ndarray"
+) -> Tuple[bytes, Tuple[float, ...]]:
+    """Demo scoring kernel (not real calculations)
+    
+    Args:
+        codes: ASCII-encoded sequence
+        r: Eight uniform draws in [0, 1)
+        corr_offset: Per-term correction coefficient times the low bound
+        corr_scale: Per-term correction coefficient times the bound span
+        
+    Returns:
+        Secondary-structure codes and the five quantum corrections followed by
+        confidence, energy and enhancement percentage
+    """
+    n = len(codes)
+    
+    # Simple heuristic secondary structure (demo only)
+    ss_codes = codes.translate(_SS_TABLE)
+    
+    # All five corrections in one multiply-add over the first five draws
+    corrections = (n * (corr_offset + corr_scale * r[:5])).tolist()
+    r_conf, r_energy, r_enh = r[5:].tolist()
+    
+    values = (
+        *corrections,
+        min(0.95, 0.6 + 0.3 * r_conf),
+        -3.5 * n + 10 * r_energy,
+        15 + 20 * r_enh
+    )
+    return ss_codes, values
+
+@dataclass(frozen=True, slots=True)
 class DemoResult:
     """Demo version of folding results"""
     sequence: str
@@ -49,7 +110,7 @@ class DemoResult:
     confidence: float
     energy: float
     enhancement_percentage: float
-    quantum_corrections: Dict[str, float]
+    quantum_corrections: Tuple[float, ...]
     folding_time: float
     license_notice: str
 
@@ -62,10 +123,34 @@ class KLTOEDemo:
     in the licensed version.
     """
     
-    def __init__(self):
+    # Quantum correction terms, in the order stored in DemoResult.quantum_corrections
+    _CORRECTION_LABELS = (
+        "vacuum_compression",
+        "time_structure",
+        "recursive_coupling",
+        "nonlocal_correlation",
+        "phase_coherence"
+    )
+    
+    # Demo correction for each term is coefficient * n * uniform(low, high)
+    _CORRECTION_COEFFICIENTS = (-0.1, 0.05, -0.03, 0.01, 0.15)
+    _CORRECTION_LOW = (0.8, 0.9, 0.7, 0.5, 1.0)
+    _CORRECTION_HIGH = (1.2, 1.1, 1.3, 1.5, 1.2)
+    
+    # Total simulated processing time for uncached sequences (seconds)
+    _PROGRESS_DURATION = 2.1
+    
+    def __init__(self, seed: Optional[int] = None):
         self.version = "Demo v1.0.0"
         self.license_status = "DEMONSTRATION ONLY"
         
+        # Instance-local generator for demo results on unknown sequences,
+        # created on first use so known sequences never import numpy
+        self._seed = seed
+        self._rng = None
+        self._corr_offset = None
+        self._corr_scale = None
+        
         # Pre-calculated demo results for common test sequences
         self.demo_results = {
             "MKTAYIAKQRQISFVKSHFSRQ": {
@@ -132,25 +217,45 @@ class KLTOEDemo:
             "quantum_fidelity": 99.9,
             "operational_qubits": 260
         }
+        
+        # Results returned by fold_protein, keyed by sequence; seeded with the
+        # pre-calculated results so known sequences are a single lookup
+        self._cache: Dict[str, DemoResult] = {
+            seq: DemoResult(
+                sequence=seq,
+                secondary_structure=data["secondary_structure"],
+                confidence=data["confidence"],
+                energy=data["energy"],
+                enhancement_percentage=data["enhancement"],
+                quantum_corrections=tuple(
+                    data["quantum_corrections"][term] for term in self._CORRECTION_LABELS
+                ),
+                folding_time=1.2,
+                license_notice="Full analysis requires licensed version"
+            )
+            for seq, data in self.demo_results.items()
+        }
     
     def show_banner(self):
         """Display demo banner"""
-        print(DEMO_BANNER)
-        print(LICENSE_NOTICE)
-        print()
+        sys.stdout.write("\n".join([DEMO_BANNER, LICENSE_NOTICE, ""]) + "\n")
     
     def show_calibration_info(self):
         """Display IBM quantum calibration information (demo version)"""
-        print("📡 IBM QUANTUM CALIBRATION DATA")
-        print("=" * 40)
-        print(f"Brisbane (127-qubit): T1={{self.demo_calibration['brisbane_t1']:.1f}}μs, T2={{self.demo_calibration['brisbane_t2']:.1f}}μs")
-        print(f"Torino (133-qubit): T1={{self.demo_calibration['torino_t1']:.1f}}μs, T2={{self.demo_calibration['torino_t2']:.1f}}μs")
-        print(f"Total operational qubits: {{self.demo_calibration['operational_qubits']}}")
-        print(f"Quantum fidelity: {{self.demo_calibration['quantum_fidelity']:.1f}}%")
-        print()
+        cal = self.demo_calibration
+        lines = [
+            "📡 IBM QUANTUM CALIBRATION DATA",
+            "=" * 40,
+            f"Brisbane (127-qubit): T1={cal['brisbane_t1']:.1f}μs, T2={cal['brisbane_t2']:.1f}μs",
+            f"Torino (133-qubit): T1={cal['torino_t1']:.1f}μs, T2={cal['torino_t2']:.1f}μs",
+            f"Total operational qubits: {cal['operational_qubits']}",
+            f"Quantum fidelity: {cal['quantum_fidelity']:.1f}%",
+            ""
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def fold_protein(self, sequence: str, show_progress: bool = True) -> DemoResult:
-        """Demo protein folding function"""
+        """Demo protein folding function
         
         Args:
             sequence: Amino acid sequence
@@ -159,9 +264,13 @@ class KLTOEDemo:
         Returns:
             DemoResult with pre-calculated or estimated results
         """        
+        # Cached and pre-calculated results are a dict hit, so they skip the simulated delay
+        result = self._cache.get(sequence)
+        is_cached = result is not None
+        
         if show_progress:
-            print(f"🧬 Folding sequence: {{sequence}}")
-            print(f"   Length: {{len(sequence)}} residues")
+            print(f"🧬 Folding sequence: {sequence}")
+            print(f"   Length: {len(sequence)} residues")
             print()            
             # Simulated progress
             steps = [
@@ -174,65 +283,52 @@ class KLTOEDemo:
                 "Finalizing results..."
             ]
             
+            # Simulate processing time against a single deadline so the total
+            # stays fixed however many steps there are; KLTOE_FAST disables it
+            simulate = not is_cached and not os.environ.get("KLTOE_FAST")
+            step_time = self._PROGRESS_DURATION / len(steps)
+            start = time.monotonic()
+            
             for i, step in enumerate(steps):
-                print(f"   [{{i+1}}/{{len(steps)}}] {{step}}")
-                time.sleep(0.3)  # Simulate processing time
+                print(f"   [{i+1}/{len(steps)}] {step}")
+                if simulate:
+                    remaining = start + step_time * (i + 1) - time.monotonic()
+                    if remaining > 0:
+                        time.sleep(remaining)
         
-        start_time = time.time()
+        if is_cached:
+            return result
         
-        # Check if we have a pre-calculated result
-        if sequence in self.demo_results:
-            demo_data = self.demo_results[sequence]
-            folding_time = time.time() - start_time + 1.2  # Add some realistic time
-            
-            result = DemoResult(
-                sequence=sequence,
-                secondary_structure=demo_data["secondary_structure"],
-                confidence=demo_data["confidence"],
-                energy=demo_data["energy"],
-                enhancement_percentage=demo_data["enhancement"],
-                quantum_corrections=demo_data["quantum_corrections"],
-                folding_time=folding_time,
-                license_notice="Full analysis requires licensed version"
-            )
-            
-        else:
-            # Generate plausible-looking results for unknown sequences
-            result = self._generate_demo_result(sequence, time.time() - start_time + 1.5)
+        # Generate plausible-looking results for unknown sequences
+        start_time = time.time()
+        result = self._generate_demo_result(sequence, time.time() - start_time + 1.5)
         
+        self._cache[sequence] = result
         return result
     
     def _generate_demo_result(self, sequence: str, folding_time: float) -> DemoResult:
         """Generate plausible demo results for arbitrary sequences"""
         
-        n = len(sequence)
+        if self._rng is None:
+            import numpy as np
+            self._rng = np.random.default_rng(self._seed)
+            coef = np.array(self._CORRECTION_COEFFICIENTS)
+            low = np.array(self._CORRECTION_LOW)
+            self._corr_offset = coef * low
+            self._corr_scale = coef * (np.array(self._CORRECTION_HIGH) - low)
         
-        # Simple heuristic secondary structure (demo only)
-        ss = ""
-        for i, aa in enumerate(sequence):
-            if aa in "AELM":  # Helix-favoring
-                ss += "H"
-            elif aa in "VIFY":  # Beta-favoring  
-                ss += "B"
-            else:
-                ss += "L"
-        
-        # Demo quantum corrections (not real calculations)
-        quantum_corrections = {
-            "vacuum_compression": -0.1 * n * np.random.uniform(0.8, 1.2),
-            "time_structure": 0.05 * n * np.random.uniform(0.9, 1.1),
-            "recursive_coupling": -0.03 * n * np.random.uniform(0.7, 1.3),
-            "nonlocal_correlation": 0.01 * n * np.random.uniform(0.5, 1.5),
-            "phase_coherence": 0.15 * n * np.random.uniform(1.0, 1.2)
-        }
+        # One batched draw for every random term in the demo result
+        ss_codes, values = _demo_kernel(
+            sequence.encode("ascii"), self._rng.random(8), self._corr_offset, self._corr_scale
+        )
         
         return DemoResult(
             sequence=sequence,
-            secondary_structure=ss,
-            confidence=min(0.95, 0.6 + 0.3 * np.random.random()),
-            energy=-3.5 * n + 10 * np.random.random(),
-            enhancement_percentage=15 + 20 * np.random.random(),
-            quantum_corrections=quantum_corrections,
+            secondary_structure=ss_codes.decode("ascii"),
+            confidence=values[5],
+            energy=values[6],
+            enhancement_percentage=values[7],
+            quantum_corrections=values[:5],
             folding_time=folding_time,
             license_notice="Demo result - Full version available for licensing"
         )
@@ -240,42 +336,49 @@ class KLTOEDemo:
     def display_results(self, result: DemoResult):
         """Display folding results in formatted output"""
         
-        print("\n" + "="*60)
-        print("🎯 KLTOE QUANTUM-ENHANCED FOLDING RESULTS")
-        print("="*60)
-        
-        print(f"Sequence: {{result.sequence}}")
-        print(f"Length: {{len(result.sequence)}} residues")
-        print(f"Secondary Structure: {{result.secondary_structure}}")
-        print(f"Confidence: {{result.confidence:.3f}}")
-        print(f"Final Energy: {{result.energy:.2f}} kJ/mol")
-        print(f"Enhancement: {{result.enhancement_percentage:.1f}}% improvement over classical")
-        print(f"Folding Time: {{result.folding_time:.2f}} seconds")
-        
-        print(f"\n⚡ QUANTUM FIELD CORRECTIONS:")
-        for term, energy in result.quantum_corrections.items():
+        lines = [
+            "\n" + "="*60,
+            "🎯 KLTOE QUANTUM-ENHANCED FOLDING RESULTS",
+            "="*60,
+            _RESULT_TEMPLATE.format_map({
+                "sequence": result.sequence,
+                "length": len(result.sequence),
+                "secondary_structure": result.secondary_structure,
+                "confidence": result.confidence,
+                "energy": result.energy,
+                "enhancement_percentage": result.enhancement_percentage,
+                "folding_time": result.folding_time
+            }),
+            "\n⚡ QUANTUM FIELD CORRECTIONS:"
+        ]
+        for term, energy in zip(self._CORRECTION_LABELS, result.quantum_corrections):
             term_formatted = term.replace('_', ' ').title()
-            print(f"   {{term_formatted}}: {{energy:.4f}} kJ/mol")
+            lines.append(f"   {term_formatted}: {energy:.4f} kJ/mol")
         
-        print(f"\n🔒 LICENSE NOTICE:")
-        print(f"   {{result.license_notice}}")
-        print(f"   📧 Contact: keith@kltoe.org for full implementation")
-        
-        print("="*60)
+        lines += [
+            "\n🔒 LICENSE NOTICE:",
+            f"   {result.license_notice}",
+            "   📧 Contact: keith@kltoe.org for full implementation",
+            "="*60
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def show_licensing_info(self):
         """Display licensing information"""
         
-        print("\n💼 COMMERCIAL LICENSING OPTIONS")
-        print("="*40)
-        print("Research License:    $25,000/year  (Academic use)")
-        print("Commercial License:  $100,000+    (Commercial deployment)")  
-        print("Enterprise License:  $500,000+    (Full IP access)")
-        print("API Service:         $0.10/fold   (Cloud-hosted)")
-        print()        
-        print("📧 Licensing inquiries: keith@kltoe.org")
-        print("📋 Full details: LICENSING_OPTIONS.md")
-        print("⏱️  Response time: Within 48 hours")
+        lines = [
+            "\n💼 COMMERCIAL LICENSING OPTIONS",
+            "="*40,
+            "Research License:    $25,000/year  (Academic use)",
+            "Commercial License:  $100,000+    (Commercial deployment)",
+            "Enterprise License:  $500,000+    (Full IP access)",
+            "API Service:         $0.10/fold   (Cloud-hosted)",
+            "",
+            "📧 Licensing inquiries: keith@kltoe.org",
+            "📋 Full details: LICENSING_OPTIONS.md",
+            "⏱️  Response time: Within 48 hours"
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Main demo function"""    
@@ -302,6 +405,13 @@ def main():
         help="Show commercial licensing options"
     )
     
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for reproducible results on unknown sequences"
+    )
+    
     parser.add_argument(
         "--no-progress",
         action="store_true",
@@ -311,7 +421,7 @@ def main():
     args = parser.parse_args()
     
     # Initialize demo
-    demo = KLTOEDemo()
+    demo = KLTOEDemo(seed=args.seed)
     demo.show_banner()
     
     # Show calibration info if requested
@@ -319,10 +429,9 @@ def main():
         demo.show_calibration_info()
     
     # Validate sequence
-    valid_aa = set("ACDEFGHIKLMNPQRSTVWY")
     sequence = args.sequence.upper().strip()
     
-    if not all(aa in valid_aa for aa in sequence):
+    if _INVALID_AA_RE.search(sequence):
         print("❌ Error: Invalid amino acid sequence")
         print("   Use only standard 20 amino acids: ACDEFGHIKLMNPQRSTVWY")
         return
@@ -343,7 +452,7 @@ def main():
         demo.display_results(result)
         
     except Exception as e:
-        print(f"❌ Demo error: {{e}}")
+        print(f"❌ Demo error: {e}")
         print("📧 For support: keith@kltoe.org")
     
     # Show licensing info if requested